@@ -1,15 +1,21 @@
 """Tkinter graphical user interface for TransferWithEther."""
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import functools
 import os
-import queue
 import threading
 import tkinter as tk
+from collections.abc import Coroutine
 from tkinter import filedialog, messagebox, ttk
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from . import network
 
+# How often Tk hands control to the asyncio loop while tasks are running.
+_LOOP_PUMP_INTERVAL_MS = 10
+
 
 class FileTransferApp:
     """Encapsulates the Tkinter GUI and background worker threads."""
@@ -25,18 +31,25 @@ class FileTransferApp:
         self.host_var = tk.StringVar()
         self.port_var = tk.StringVar(value="5001")
         self.file_var = tk.StringVar()
+        self.streams_var = tk.StringVar(value="1")
         self.destination_var = tk.StringVar(value=str(os.getcwd()))
         self.status_var = tk.StringVar(value="Select sender or receiver mode to begin.")
         self.progress_var = tk.DoubleVar(value=0.0)
 
-        self._worker_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
-        self._ui_queue: queue.Queue[tuple[str, tuple]] = queue.Queue()
+        # Operations are asyncio tasks on a loop driven from the Tk main loop, so
+        # every UI update happens on this thread. Blocking socket work runs on
+        # one long-lived worker thread.
+        self._loop = asyncio.new_event_loop()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._pump_scheduled = False
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="twe-io")
+        self._current_task: Optional[asyncio.Task[None]] = None
+        self._stop_event = network.StopEvent()
 
         self._build_ui()
         self._refresh_ip_addresses(force_default=True)
         self._update_widget_state()
-        self.root.after(100, self._process_ui_queue)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ------------------------------------------------------------------ UI SETUP
     def _build_ui(self) -> None:
@@ -61,7 +74,9 @@ class FileTransferApp:
         self.host_combobox = ttk.Combobox(connection_frame, textvariable=self.host_var)
         self.host_combobox.grid(row=0, column=1, sticky="we", padx=4, pady=4)
 
-        self.refresh_button = ttk.Button(connection_frame, text="Refresh", command=self._refresh_ip_addresses)
+        self.refresh_button = ttk.Button(
+            connection_frame, text="Refresh", command=lambda: self._refresh_ip_addresses(use_cache=False)
+        )
         self.refresh_button.grid(row=0, column=2, padx=4, pady=4)
 
         ttk.Label(connection_frame, text="Port:").grid(row=0, column=3, sticky="e", padx=4, pady=4)
@@ -82,6 +97,12 @@ class FileTransferApp:
         self.browse_button = ttk.Button(file_frame, text="Browse", command=self._select_file)
         self.browse_button.grid(row=0, column=2, padx=4, pady=4)
 
+        ttk.Label(file_frame, text="Streams:").grid(row=0, column=3, sticky="e", padx=4, pady=4)
+        self.streams_spinbox = ttk.Spinbox(
+            file_frame, from_=1, to=network.MAX_STREAMS, textvariable=self.streams_var, width=4
+        )
+        self.streams_spinbox.grid(row=0, column=4, sticky="w", padx=4, pady=4)
+
         ttk.Label(file_frame, text="Save to:").grid(row=1, column=0, sticky="e", padx=4, pady=4)
         self.destination_entry = ttk.Entry(file_frame, textvariable=self.destination_var)
         self.destination_entry.grid(row=1, column=1, sticky="we", padx=4, pady=4)
@@ -96,7 +117,7 @@ class FileTransferApp:
 
         self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self._cancel_action)
         self.cancel_button.pack(side="left", padx=4)
-        self.cancel_button.configure(state="disabled")
+        self.cancel_button.state(["disabled"])
 
         progress_frame = ttk.LabelFrame(self.root, text="Progress")
         progress_frame.pack(fill="both", expand=True, padx=12, pady=8)
@@ -107,53 +128,68 @@ class FileTransferApp:
         self.status_label = ttk.Label(progress_frame, textvariable=self.status_var, wraplength=660, justify="left")
         self.status_label.pack(fill="x", padx=8, pady=8)
 
+        # Widget groups toggled together; ``ttk.Widget.state`` sets a whole
+        # state list in a single Tcl call.
+        self._shared_widgets = (self.host_combobox, self.port_entry, self.refresh_button, self.start_button)
+        self._sender_widgets = (self.check_button, self.file_entry, self.browse_button, self.streams_spinbox)
+        self._receiver_widgets = (self.destination_entry, self.destination_button)
+
     # ------------------------------------------------------------------ HELPERS
     def _set_status(self, message: str) -> None:
         self.status_var.set(message)
 
-    def _post(self, action: str, *args) -> None:
-        self._ui_queue.put((action, args))
-
-    def _process_ui_queue(self) -> None:
-        while True:
-            try:
-                action, args = self._ui_queue.get_nowait()
-            except queue.Empty:
-                break
-            else:
-                getattr(self, f"_handle_{action}")(*args)
-        self.root.after(100, self._process_ui_queue)
-
-    def _handle_status(self, message: str) -> None:
-        self._set_status(message)
-
-    def _handle_progress(self, value: float) -> None:
-        self.progress_var.set(value)
+    def _post_status(self, message: str) -> None:
+        """Show ``message`` from a worker thread."""
+        self._loop.call_soon_threadsafe(self._set_status, message)
+
+    def _post_progress(self, value: float) -> None:
+        """Show ``value`` percent from a worker thread."""
+        self._loop.call_soon_threadsafe(self.progress_var.set, value)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """Schedule ``coro`` on the asyncio loop and keep the loop pumped until it ends."""
+        task = self._loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if not self._pump_scheduled:
+            self._pump_scheduled = True
+            self.root.after(_LOOP_PUMP_INTERVAL_MS, self._pump_loop)
+        return task
+
+    def _pump_loop(self) -> None:
+        """Run the asyncio callbacks that are ready, then yield back to Tk."""
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+        self._pump_scheduled = bool(self._tasks)
+        if self._pump_scheduled:
+            self.root.after(_LOOP_PUMP_INTERVAL_MS, self._pump_loop)
 
     def _reset_progress(self) -> None:
         self.progress_var.set(0.0)
 
+    def _apply_mode_state(self, is_sender: bool) -> None:
+        """Enable the widgets of the current mode and disable those of the other."""
+        enabled, disabled = (
+            (self._sender_widgets, self._receiver_widgets) if is_sender else (self._receiver_widgets, self._sender_widgets)
+        )
+        for widget in enabled:
+            widget.state(["!disabled"])
+        for widget in disabled:
+            widget.state(["disabled"])
+        self.host_combobox.state(["!disabled", "!readonly" if is_sender else "readonly"])
+
     def _update_widget_state(self) -> None:
         mode = self.mode_var.get()
         is_sender = mode == "sender"
 
-        if is_sender:
-            self.host_combobox.configure(state="normal")
-        else:
-            self.host_combobox.configure(state="readonly")
+        self._apply_mode_state(is_sender)
+        if not is_sender:
             available_values = self.host_combobox.cget("values")
             if isinstance(available_values, str):
                 available_values = available_values.split()
             if self.host_var.get() not in available_values:
                 self._refresh_ip_addresses(force_default=True)
 
-        self.check_button.configure(state="normal" if is_sender else "disabled")
-        self.file_entry.configure(state="normal" if is_sender else "disabled")
-        self.browse_button.configure(state="normal" if is_sender else "disabled")
-
-        self.destination_entry.configure(state="disabled" if is_sender else "normal")
-        self.destination_button.configure(state="disabled" if is_sender else "normal")
-
         if is_sender:
             self.status_var.set("Select a file and click Start to send.")
         else:
@@ -169,8 +205,20 @@ class FileTransferApp:
             messagebox.showerror("Invalid Port", "Please enter a port number between 1 and 65535.")
             return None
 
-    def _refresh_ip_addresses(self, force_default: bool = False) -> None:
-        addresses = network.get_local_ip_addresses()
+    def _get_streams(self) -> Optional[int]:
+        try:
+            streams = int(self.streams_var.get())
+            if not (1 <= streams <= network.MAX_STREAMS):
+                raise ValueError
+            return streams
+        except ValueError:
+            messagebox.showerror(
+                "Invalid Streams", f"Please enter a number of streams between 1 and {network.MAX_STREAMS}."
+            )
+            return None
+
+    def _refresh_ip_addresses(self, force_default: bool = False, use_cache: bool = True) -> None:
+        addresses = network.get_local_ip_addresses(use_cache=use_cache)
         if not addresses:
             addresses = ["127.0.0.1"]
 
@@ -196,11 +244,12 @@ class FileTransferApp:
 
         self._set_status("Checking connection...")
 
-        def worker() -> None:
-            success, message = network.check_connection(host, port)
-            self._post("status", message)
+        async def check() -> None:
+            # The default executor keeps checks from queueing behind a transfer.
+            success, message = await self._loop.run_in_executor(None, network.check_connection, host, port)
+            self._set_status(message)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._spawn(check())
 
     def _select_file(self) -> None:
         file_path = filedialog.askopenfilename(title="Select file to send")
@@ -212,8 +261,11 @@ class FileTransferApp:
         if directory:
             self.destination_var.set(directory)
 
+    def _is_busy(self) -> bool:
+        return self._current_task is not None and not self._current_task.done()
+
     def _start_action(self) -> None:
-        if self._worker_thread and self._worker_thread.is_alive():
+        if self._is_busy():
             messagebox.showinfo("Transfer in progress", "Please wait for the current operation to finish or cancel it.")
             return
 
@@ -222,8 +274,9 @@ class FileTransferApp:
             return
 
         mode = self.mode_var.get()
-        self._stop_event = threading.Event()
-        self._post("progress", 0.0)
+        self._stop_event.close()
+        self._stop_event = network.StopEvent()
+        self._reset_progress()
 
         if mode == "sender":
             file_path = self.file_var.get()
@@ -237,15 +290,13 @@ class FileTransferApp:
             if not os.path.exists(file_path):
                 messagebox.showerror("File Not Found", "The selected file no longer exists.")
                 return
+            streams = self._get_streams()
+            if streams is None:
+                return
 
             self._set_status("Connecting to receiver...")
             self._disable_controls()
-            self._worker_thread = threading.Thread(
-                target=self._send_worker,
-                args=(host, port, file_path, self._stop_event),
-                daemon=True,
-            )
-            self._worker_thread.start()
+            self._start_worker(self._send_worker, host, port, file_path, streams)
         else:
             destination = self.destination_var.get()
             if not destination:
@@ -254,102 +305,84 @@ class FileTransferApp:
 
             self._set_status("Waiting for sender...")
             self._disable_controls()
-            self._worker_thread = threading.Thread(
-                target=self._receive_worker,
-                args=(port, destination, self._stop_event),
-                daemon=True,
-            )
-            self._worker_thread.start()
+            self._start_worker(self._receive_worker, port, destination)
 
     def _cancel_action(self) -> None:
-        if self._worker_thread and self._worker_thread.is_alive():
+        if self._is_busy():
+            # The stop event reaches the worker even if the task has not started yet.
+            self.cancel_button.state(["disabled"])
             self._stop_event.set()
+            self._current_task.cancel()
             self._set_status("Cancellation requested. Waiting for the current operation to stop...")
         else:
             self._set_status("Nothing to cancel.")
 
     # ------------------------------------------------------------------ WORKER MANAGEMENT
     def _disable_controls(self) -> None:
-        for widget in (
-            self.host_combobox,
-            self.port_entry,
-            self.check_button,
-            self.refresh_button,
-            self.file_entry,
-            self.browse_button,
-            self.destination_entry,
-            self.destination_button,
-            self.start_button,
-        ):
-            widget.configure(state="disabled")
-        self.cancel_button.configure(state="normal")
+        for widget in (*self._shared_widgets, *self._sender_widgets, *self._receiver_widgets):
+            widget.state(["disabled"])
+        self.cancel_button.state(["!disabled"])
 
     def _enable_controls(self) -> None:
-        self.port_entry.configure(state="normal")
-        self.start_button.configure(state="normal")
-        self.cancel_button.configure(state="disabled")
-
-        if self.mode_var.get() == "sender":
-            self.host_combobox.configure(state="normal")
-            self.check_button.configure(state="normal")
-            self.file_entry.configure(state="normal")
-            self.browse_button.configure(state="normal")
-            self.destination_entry.configure(state="disabled")
-            self.destination_button.configure(state="disabled")
-        else:
-            self.host_combobox.configure(state="readonly")
-            self.check_button.configure(state="disabled")
-            self.file_entry.configure(state="disabled")
-            self.browse_button.configure(state="disabled")
-            self.destination_entry.configure(state="normal")
-            self.destination_button.configure(state="normal")
-        self.refresh_button.configure(state="normal")
-
-    def _send_worker(self, host: str, port: int, file_path: str, stop_event: threading.Event) -> None:
+        for widget in self._shared_widgets:
+            widget.state(["!disabled"])
+        self.cancel_button.state(["disabled"])
+        self._apply_mode_state(self.mode_var.get() == "sender")
+
+    def _start_worker(self, worker: Callable[..., None], *args: Any) -> None:
+        task = self._spawn(self._run_worker(worker, *args, stop_event=self._stop_event))
+        # A done-callback also runs for a task cancelled before its first step.
+        task.add_done_callback(self._handle_finish)
+        self._current_task = task
+
+    async def _run_worker(self, worker: Callable[..., None], *args: Any, stop_event: threading.Event) -> None:
+        """Run ``worker`` on the I/O thread; cancelling the task stops the transfer."""
+        job = functools.partial(worker, *args, stop_event=stop_event)
+        future = self._loop.run_in_executor(self._executor, job)
         try:
-            def on_progress(bytes_sent: int, total_bytes: int) -> None:
-                percent = (bytes_sent / total_bytes * 100) if total_bytes else 0.0
-                self._post("progress", percent)
-
-            def on_status(message: str) -> None:
-                self._post("status", message)
-
-            network.send_file(
-                host,
-                port,
-                file_path,
-                progress_callback=on_progress,
-                status_callback=on_status,
-                stop_event=stop_event,
-            )
+            # A running thread cannot be interrupted, so every cancellation just
+            # asks it to stop and the task keeps waiting until it has finished.
+            while not future.done():
+                try:
+                    await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    stop_event.set()
+            future.result()
         except Exception as exc:  # pragma: no cover - GUI feedback path
-            self._post("status", f"Error: {exc}")
-        finally:
-            self._post("finish", "")
+            self._set_status(f"Error: {exc}")
+
+    def _send_worker(
+        self, host: str, port: int, file_path: str, streams: int, stop_event: threading.Event
+    ) -> None:
+        def on_progress(bytes_sent: int, total_bytes: int) -> None:
+            percent = (bytes_sent / total_bytes * 100) if total_bytes else 0.0
+            self._post_progress(percent)
+
+        network.send_file(
+            host,
+            port,
+            file_path,
+            progress_callback=on_progress,
+            status_callback=self._post_status,
+            streams=streams,
+            stop_event=stop_event,
+        )
 
     def _receive_worker(self, port: int, destination: str, stop_event: threading.Event) -> None:
-        try:
-            def on_progress(bytes_received: int, total_bytes: int) -> None:
-                percent = (bytes_received / total_bytes * 100) if total_bytes else 0.0
-                self._post("progress", percent)
-
-            def on_status(message: str) -> None:
-                self._post("status", message)
-
-            network.receive_file(
-                port,
-                destination,
-                progress_callback=on_progress,
-                status_callback=on_status,
-                stop_event=stop_event,
-            )
-        except Exception as exc:  # pragma: no cover - GUI feedback path
-            self._post("status", f"Error: {exc}")
-        finally:
-            self._post("finish", "")
+        def on_progress(bytes_received: int, total_bytes: int) -> None:
+            percent = (bytes_received / total_bytes * 100) if total_bytes else 0.0
+            self._post_progress(percent)
+
+        network.receive_file(
+            port,
+            destination,
+            progress_callback=on_progress,
+            status_callback=self._post_status,
+            stop_event=stop_event,
+        )
 
-    def _handle_finish(self, _message: str) -> None:
-        self._worker_thread = None
+    def _handle_finish(self, _task: asyncio.Task[None]) -> None:
+        self._current_task = None
         self._enable_controls()
         current_status = self.status_var.get()
         lowered = current_status.lower()
@@ -362,6 +395,17 @@ class FileTransferApp:
         else:
             self.status_var.set(ready_message)
 
+    def _on_close(self) -> None:
+        # The pool's worker is not a daemon thread, so stop any running
+        # transfer before the interpreter waits for it on exit. Setting the
+        # stop event also shuts down the sender's sockets, so a blocked send
+        # returns at once; connecting gives up after a timeout.
+        for task in self._tasks:
+            task.cancel()
+        self._stop_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     # ------------------------------------------------------------------ PUBLIC API
     def run(self) -> None:
         self.root.mainloop()
@@ -5,19 +5,125 @@ Tkinter based GUI, but can also be imported and reused programmatically.
 """
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import errno
+import functools
+import ipaddress
 import os
+import queue
+import selectors
+import shutil
 import socket
 import struct
+import threading
+import time
+import zlib
 from pathlib import Path
-from typing import Callable, Optional
-
-# Header format: unsigned int for the filename length, unsigned long long for file size.
-_HEADER_STRUCT = struct.Struct("!IQ")
+from typing import BinaryIO, Callable, Iterator, NamedTuple, Optional, Union
+
+# Header format: protocol magic and version byte, unsigned int for the filename length,
+# unsigned long long for file size, then unsigned shorts for the stream count and index
+# and unsigned long longs for the offset and length of the range carried by this connection.
+_HEADER_STRUCT = struct.Struct("!3sBIQHHQQ")
+_PROTOCOL_MAGIC = b"TWE"
+# Bump whenever the header or footer layout changes.
+_PROTOCOL_VERSION = 1
+# Footer format: CRC-32 of the range contents, sent after its last data byte.
+_FOOTER_STRUCT = struct.Struct("!I")
+
+# Most parallel connections a single transfer may use.
+MAX_STREAMS = 16
+
+# How long local IP address lookups are reused, in seconds.
+_IP_CACHE_SECONDS = 30
+
+# Largest file size a receiver accepts from a header (16 TiB).
+_MAX_FILE_SIZE = 1 << 44
+# Longest encoded file name a receiver accepts from a header, in bytes.
+_MAX_NAME_LENGTH = 4096
+
+# Default size of each send/recv call. Large chunks amortise per-call overhead.
+_DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Chunks the reader thread may run ahead of the socket in the pipelined sender.
+_READ_AHEAD_CHUNKS = 4
+# Default minimum time between two progress callbacks, in seconds (about 33 Hz).
+_PROGRESS_INTERVAL = 0.03
+# Requested kernel socket buffer size, large enough for a high bandwidth-delay product.
+_SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+# How long the sender waits for each connection to the receiver, in seconds.
+_CONNECT_TIMEOUT = 10.0
+# How often listeners re-check a plain ``threading.Event`` that cannot wake a selector.
+_STOP_POLL_INTERVAL = 1.0
 
 ProgressCallback = Callable[[int, int], None]
 StatusCallback = Callable[[str], None]
 
 
+class StopEvent(threading.Event):
+    """A :class:`threading.Event` that also wakes up blocked socket waits.
+
+    Setting the event writes to an internal socket pair, so ``receive_file``
+    can sleep in ``select`` without periodically polling for cancellation.
+    It also shuts down the sockets ``send_file`` registers, which interrupts
+    a send blocked on a receiver that stopped reading.
+    Plain ``threading.Event`` objects are still accepted everywhere.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self._sockets: set[socket.socket] = set()
+        self._sockets_lock = threading.Lock()
+
+    def set(self) -> None:
+        with self._sockets_lock:
+            super().set()
+            for sock in self._sockets:
+                _abort_socket(sock)
+        try:
+            self._wake_writer.send(b"\0")
+        except OSError:  # pragma: no cover - already closed or already signalled
+            pass
+
+    @contextlib.contextmanager
+    def aborting(self, sock: socket.socket) -> Iterator[socket.socket]:
+        """Shut down ``sock`` when the event is set while the block is active."""
+        with self._sockets_lock:
+            if self.is_set():
+                _abort_socket(sock)
+            self._sockets.add(sock)
+        try:
+            yield sock
+        finally:
+            with self._sockets_lock:
+                self._sockets.discard(sock)
+
+    def clear(self) -> None:
+        super().clear()
+        try:
+            while self._wake_reader.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def fileno(self) -> int:
+        """Return a descriptor that becomes readable once the event is set."""
+        return self._wake_reader.fileno()
+
+    def close(self) -> None:
+        """Release the wake-up sockets."""
+        self._wake_reader.close()
+        self._wake_writer.close()
+
+
+def _abort_socket(sock: socket.socket) -> None:
+    with contextlib.suppress(OSError):
+        sock.shutdown(socket.SHUT_RDWR)
+
+
 def check_connection(host: str, port: int, timeout: float = 3.0) -> tuple[bool, str]:
     """Check if a TCP connection to ``host``/``port`` can be established.
 
@@ -30,13 +136,32 @@ def check_connection(host: str, port: int, timeout: float = 3.0) -> tuple[bool,
         return False, f"Connection failed: {exc}"  # type: ignore[str-bytes-safe]
 
 
-def get_local_ip_addresses(include_loopback: bool = True) -> list[str]:
+def get_local_ip_addresses(include_loopback: bool = True, *, use_cache: bool = True) -> list[str]:
     """Return IPv4 addresses associated with the current host.
 
     The list is deduplicated and sorted so that non-loopback addresses are
     preferred. The loopback address (``127.0.0.1``) can optionally be removed.
+    Host name lookups can be slow, so results are reused for up to
+    ``_IP_CACHE_SECONDS`` unless ``use_cache`` is false.
     """
+    if not use_cache:
+        _lookup_ip_addresses.cache_clear()
+    cache_bucket = int(time.monotonic() // _IP_CACHE_SECONDS)
+    return list(_lookup_ip_addresses(include_loopback, cache_bucket))
+
 
+def _is_ipv4(value: str) -> bool:
+    """Return whether ``value`` is a well-formed dotted IPv4 address."""
+    try:
+        ipaddress.IPv4Address(value)
+    except ValueError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=2)
+def _lookup_ip_addresses(include_loopback: bool, _cache_bucket: int) -> tuple[str, ...]:
+    """Cached lookup behind :func:`get_local_ip_addresses`, keyed by a time bucket."""
     addresses: set[str] = set()
 
     try:
@@ -47,8 +172,10 @@ def get_local_ip_addresses(include_loopback: bool = True) -> list[str]:
         pass
 
     try:
-        # Attempt to determine the default outbound IP address.
+        # Attempt to determine the default outbound IP address. Connecting a UDP
+        # socket sends nothing; the timeout guards against a stalled route lookup.
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+            probe.settimeout(1.0)
             probe.connect(("8.8.8.8", 80))
             addresses.add(probe.getsockname()[0])
     except OSError:
@@ -60,8 +187,61 @@ def get_local_ip_addresses(include_loopback: bool = True) -> list[str]:
         addresses.discard("127.0.0.1")
 
     # Filter out malformed entries and sort, prioritising non-loopback values.
-    valid_addresses = [ip for ip in addresses if ip.count(".") == 3]
-    return sorted(valid_addresses, key=lambda value: (value.startswith("127."), value))
+    valid_addresses = [ip for ip in addresses if _is_ipv4(ip)]
+    return tuple(sorted(valid_addresses, key=lambda value: (value.startswith("127."), value)))
+
+
+def _stop_selector(sock: socket.socket, stop_event: threading.Event) -> selectors.BaseSelector:
+    """Return a selector watching ``sock`` and, when possible, ``stop_event``."""
+    selector = selectors.DefaultSelector()
+    selector.register(sock, selectors.EVENT_READ)
+    if isinstance(stop_event, StopEvent):
+        selector.register(stop_event, selectors.EVENT_READ)
+    return selector
+
+
+def _stop_poll_timeout(stop_event: threading.Event) -> Optional[float]:
+    """Return the selector timeout needed to notice ``stop_event`` being set."""
+    return None if isinstance(stop_event, StopEvent) else _STOP_POLL_INTERVAL
+
+
+class _TransferCancelled(Exception):
+    """Raised internally when ``stop_event`` is set while waiting for data."""
+
+
+def _wait_readable(selector: selectors.BaseSelector, stop_event: threading.Event) -> None:
+    """Block until the socket registered with ``selector`` is readable.
+
+    Raises :class:`_TransferCancelled` as soon as ``stop_event`` is set.
+    """
+    timeout = _stop_poll_timeout(stop_event)
+    while not stop_event.is_set():
+        if selector.select(timeout) and not stop_event.is_set():
+            return
+    raise _TransferCancelled
+
+
+def _tune_socket(sock: socket.socket, buffer_option: int) -> None:
+    """Disable Nagle's algorithm and enlarge the kernel buffer ``buffer_option``."""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, buffer_option, _SOCKET_BUFFER_SIZE)
+    except OSError:  # pragma: no cover - the kernel may cap or reject the size
+        pass
+
+
+def _set_cork(sock: socket.socket, enabled: bool) -> None:
+    """Toggle Linux ``TCP_CORK`` so partial segments are held back (no-op elsewhere)."""
+    if hasattr(socket, "TCP_CORK"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, int(enabled))
+
+
+def _quickack(sock: socket.socket) -> None:
+    """Ask Linux to acknowledge received data immediately (no-op elsewhere)."""
+    if hasattr(socket, "TCP_QUICKACK"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+
 def _send_all(sock: socket.socket, data: bytes) -> None:
     """Send all bytes to the socket, retrying on interruptions."""
     view = memoryview(data)
@@ -70,17 +250,243 @@ def _send_all(sock: socket.socket, data: bytes) -> None:
         view = view[sent:]
 
 
-def _recv_exact(sock: socket.socket, size: int) -> bytes:
-    """Receive exactly ``size`` bytes from ``sock``."""
-    chunks: list[bytes] = []
-    remaining = size
-    while remaining > 0:
-        chunk = sock.recv(remaining)
-        if not chunk:
+def _send_all_parts(sock: socket.socket, parts: list[Union[bytes, bytearray]]) -> None:
+    """Send ``parts`` back to back, using one scatter/gather call where possible."""
+    if not hasattr(sock, "sendmsg"):  # pragma: no cover - e.g. Windows
+        for part in parts:
+            _send_all(sock, part)
+        return
+
+    views = [memoryview(part) for part in parts if part]
+    while views:
+        sent = sock.sendmsg(views)
+        # Drop the fully sent buffers and trim the partially sent one.
+        while views and sent >= len(views[0]):
+            sent -= len(views.pop(0))
+        if views:
+            views[0] = views[0][sent:]
+
+
+def _recv_exact_into(
+    sock: socket.socket, view: memoryview, wait: Optional[Callable[[], None]] = None
+) -> None:
+    """Fill ``view`` completely with bytes received from ``sock``.
+
+    For non-blocking sockets, ``wait`` is called whenever no data is available.
+    """
+    while view:
+        try:
+            received = sock.recv_into(view)
+        except BlockingIOError:
+            if wait is None:
+                raise
+            wait()
+            continue
+        if not received:
             raise ConnectionError("Connection closed before enough data was received")
-        chunks.append(chunk)
-        remaining -= len(chunk)
-    return b"".join(chunks)
+        view = view[received:]
+
+
+def _recv_exact(sock: socket.socket, size: int, wait: Optional[Callable[[], None]] = None) -> bytes:
+    """Receive exactly ``size`` bytes from ``sock``."""
+    buffer = bytearray(size)
+    _recv_exact_into(sock, memoryview(buffer), wait)
+    return bytes(buffer)
+
+
+def _check_free_space(directory: Path, file_size: int) -> None:
+    """Reject headers announcing absurd sizes or more data than ``directory`` can hold."""
+    if file_size > _MAX_FILE_SIZE:
+        raise ConnectionError(f"Sender announced an implausible file size ({file_size} bytes)")
+    free = shutil.disk_usage(directory).free
+    if file_size > free:
+        raise OSError(errno.ENOSPC, f"Not enough free space for {file_size} bytes ({free} available)")
+
+
+def _preallocate(dst: BinaryIO, size: int) -> None:
+    """Size ``dst`` to ``size`` bytes up front so the file is not grown chunk by chunk.
+
+    ``truncate`` extends the file sparsely in constant time. ``posix_fallocate``
+    is avoided because glibc emulates it by writing every block on filesystems
+    without ``fallocate(2)``, which would stall the transfer before it starts.
+    Free space is checked separately by :func:`_check_free_space`.
+    """
+    if size:
+        dst.truncate(size)
+        dst.seek(0)
+
+
+def _open_for_streaming(path: Path) -> BinaryIO:
+    """Open ``path`` for a single sequential read, hinting the OS where possible."""
+    # ``O_SEQUENTIAL`` is the Windows counterpart of ``POSIX_FADV_SEQUENTIAL``.
+    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
+    return os.fdopen(os.open(path, flags), "rb")
+
+
+def _advise(src: BinaryIO, offset: int, length: int, advice_name: str) -> None:
+    """Apply ``os.posix_fadvise`` advice ``advice_name`` to a range of ``src`` when supported."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(src.fileno(), offset, length, advice)
+    except OSError:  # pragma: no cover - advisory only
+        pass
+
+
+def _pipelined_chunks(
+    sock: socket.socket, src: BinaryIO, count: int, chunk_size: int, checksum: int
+) -> Iterator[tuple[int, int]]:
+    """Send up to ``count`` bytes of ``src``, reading ahead on a helper thread.
+
+    Both file reads and socket sends release the GIL, so the disk and the
+    network are kept busy at the same time. The helper thread also extends
+    the CRC-32 ``checksum`` while the data is still in userspace. Yields the
+    size of each chunk sent and the checksum up to and including it.
+    """
+    chunks: queue.Queue[Union[tuple[bytes, int], BaseException, None]] = queue.Queue(maxsize=_READ_AHEAD_CHUNKS)
+    halt = threading.Event()
+
+    def reader() -> None:
+        running = checksum
+        remaining = count
+        try:
+            while remaining > 0 and not halt.is_set():
+                chunk = src.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                running = zlib.crc32(chunk, running)
+                chunks.put((chunk, running))
+                remaining -= len(chunk)
+        except BaseException as exc:  # pragma: no cover - surfaced to the sender
+            chunks.put(exc)
+            return
+        chunks.put(None)
+
+    thread = threading.Thread(target=reader, name="twe-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            chunk, running = item
+            _send_all(sock, chunk)
+            yield len(chunk), running
+    finally:
+        # Unblock a reader waiting on a full queue so it can see ``halt``.
+        halt.set()
+        while thread.is_alive():
+            try:
+                chunks.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        thread.join()
+
+
+class _Progress:
+    """Thread-safe byte counter shared by the streams of one transfer.
+
+    ``callback`` is throttled to at most one call per ``interval`` seconds,
+    so slow links still update smoothly and fast links do not flood it.
+    """
+
+    def __init__(self, total: int, callback: Optional[ProgressCallback], interval: float) -> None:
+        self._total = total
+        self._callback = callback
+        self._interval = interval
+        self._done = 0
+        self._next_report = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, count: int) -> None:
+        with self._lock:
+            self._done += count
+            if self._callback and time.monotonic() >= self._next_report:
+                self._callback(self._done, self._total)
+                self._next_report = time.monotonic() + self._interval
+
+    def finish(self) -> None:
+        if self._callback:
+            self._callback(self._total, self._total)
+
+
+def _split_ranges(size: int, streams: int, chunk_size: int) -> list[tuple[int, int]]:
+    """Split ``size`` bytes into at most ``streams`` contiguous ``(offset, length)`` ranges.
+
+    No range is shorter than ``chunk_size`` unless the file itself is, and an
+    empty file still yields a single empty range.
+    """
+    streams = max(1, min(streams, MAX_STREAMS, -(-size // chunk_size)))
+    step = -(-size // streams) if size else 0
+    ranges = [(offset, min(step, size - offset)) for offset in range(0, size, step)] if size else []
+    return ranges or [(0, 0)]
+
+
+def _run_streams(jobs: list[Callable[[], None]], socks: list[socket.socket]) -> None:
+    """Run one job per stream, in parallel when there are several.
+
+    If a stream fails, the other sockets are shut down so their jobs stop
+    too, and the first error is re-raised.
+    """
+    if len(jobs) == 1:
+        jobs[0]()
+        return
+
+    error: Optional[BaseException] = None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="twe-stream") as pool:
+        futures = [pool.submit(job) for job in jobs]
+        for future in concurrent.futures.as_completed(futures):
+            exc = future.exception()
+            if exc is not None and error is None:
+                error = exc
+                for sock in socks:
+                    _abort_socket(sock)
+    if error is not None:
+        raise error
+
+
+def _send_stream(
+    sock: socket.socket,
+    file_path: Path,
+    header: bytearray,
+    offset: int,
+    length: int,
+    chunk_size: int,
+    stop_event: threading.Event,
+    progress: _Progress,
+) -> None:
+    """Send ``length`` bytes of ``file_path`` starting at ``offset`` over ``sock``."""
+    end = offset + length
+    with _open_for_streaming(file_path) as src:
+        _advise(src, offset, length, "POSIX_FADV_SEQUENTIAL")
+        # Ship the header, filename and first chunk together so the
+        # connection starts with one full write rather than tiny packets.
+        src.seek(offset)
+        first_chunk = src.read(min(chunk_size, length))
+        _set_cork(sock, True)
+        _send_all_parts(sock, [header, first_chunk])
+        _set_cork(sock, False)
+        position = offset + len(first_chunk)
+        checksum = zlib.crc32(first_chunk)
+        progress.add(len(first_chunk))
+
+        # The range is checksummed, so every byte passes through userspace
+        # anyway; overlap disk reads and socket sends instead of alternating.
+        body = _pipelined_chunks(sock, src, end - position, chunk_size, checksum)
+        with contextlib.closing(body):
+            for sent, checksum in body:
+                progress.add(sent)
+                if stop_event.is_set():
+                    break
+
+        # The data will not be read again; do not let it crowd out other caches.
+        _advise(src, offset, length, "POSIX_FADV_DONTNEED")
+
+    if not stop_event.is_set():
+        _send_all(sock, _FOOTER_STRUCT.pack(checksum))
 
 
 def send_file(
@@ -90,17 +496,24 @@ def send_file(
     *,
     progress_callback: Optional[ProgressCallback] = None,
     status_callback: Optional[StatusCallback] = None,
-    chunk_size: int = 64 * 1024,
-    stop_event: Optional["threading.Event"] = None,
+    chunk_size: Optional[int] = None,
+    progress_interval: float = _PROGRESS_INTERVAL,
+    streams: int = 1,
+    stop_event: Optional[threading.Event] = None,
 ) -> None:
     """Send ``file_path`` to ``host``/``port``.
 
-    ``progress_callback`` receives ``(bytes_sent, total_bytes)``.
+    ``progress_callback`` receives ``(bytes_sent, total_bytes)`` at most once every
+    ``progress_interval`` seconds and once more when the transfer completes.
     ``status_callback`` receives human readable status messages.
     ``stop_event`` can be provided to abort the transfer.
-    """
-    import threading
+    ``chunk_size`` defaults to a multiple of the filesystem block size, at least 1 MiB.
 
+    With ``streams`` greater than one, the file is split into contiguous
+    ranges sent over parallel TCP connections (up to :data:`MAX_STREAMS`).
+    Each range is followed by a CRC-32 of its contents so the receiver can
+    detect corruption.
+    """
     if stop_event is None:
         stop_event = threading.Event()
 
@@ -108,55 +521,185 @@ def send_file(
     if not file_path.exists():
         raise FileNotFoundError(file_path)
 
-    file_size = file_path.stat().st_size
+    file_stat = file_path.stat()
+    file_size = file_stat.st_size
+    if chunk_size is None:
+        chunk_size = max(_DEFAULT_CHUNK_SIZE, getattr(file_stat, "st_blksize", 0) * 16)
     filename_bytes = file_path.name.encode("utf-8")
+    ranges = _split_ranges(file_size, streams, chunk_size)
 
     if status_callback:
         status_callback("Connecting to receiver...")
-    with socket.create_connection((host, port)) as sock:
-        header = _HEADER_STRUCT.pack(len(filename_bytes), file_size)
-        _send_all(sock, header)
-        _send_all(sock, filename_bytes)
+    with contextlib.ExitStack() as stack:
+        socks: list[socket.socket] = []
+        for _ in ranges:
+            sock = stack.enter_context(socket.create_connection((host, port), timeout=_CONNECT_TIMEOUT))
+            sock.settimeout(None)
+            if isinstance(stop_event, StopEvent):
+                stack.enter_context(stop_event.aborting(sock))
+            _tune_socket(sock, socket.SO_SNDBUF)
+            socks.append(sock)
 
-        bytes_sent = 0
         if status_callback:
             status_callback("Transferring file...")
 
-        with file_path.open("rb") as src:
-            while not stop_event.is_set():
-                chunk = src.read(chunk_size)
-                if not chunk:
-                    break
-                _send_all(sock, chunk)
-                bytes_sent += len(chunk)
-                if progress_callback:
-                    progress_callback(bytes_sent, file_size)
+        progress = _Progress(file_size, progress_callback, progress_interval)
+        jobs: list[Callable[[], None]] = []
+        for index, (sock, (offset, length)) in enumerate(zip(socks, ranges)):
+            # Build header and filename in one buffer instead of packing and concatenating.
+            header = bytearray(_HEADER_STRUCT.size + len(filename_bytes))
+            _HEADER_STRUCT.pack_into(
+                header,
+                0,
+                _PROTOCOL_MAGIC,
+                _PROTOCOL_VERSION,
+                len(filename_bytes),
+                file_size,
+                len(ranges),
+                index,
+                offset,
+                length,
+            )
+            header[_HEADER_STRUCT.size :] = filename_bytes
+            jobs.append(
+                functools.partial(
+                    _send_stream,
+                    sock,
+                    file_path,
+                    header,
+                    offset,
+                    length,
+                    chunk_size,
+                    stop_event,
+                    progress,
+                )
+            )
+        try:
+            _run_streams(jobs, socks)
+        except OSError:
+            # Setting a ``StopEvent`` shuts the sockets down under the senders.
+            if not stop_event.is_set():
+                raise
 
         if stop_event.is_set():
             if status_callback:
                 status_callback("Transfer cancelled by user.")
         else:
-            if progress_callback:
-                progress_callback(file_size, file_size)
+            progress.finish()
             if status_callback:
                 status_callback("Transfer completed successfully.")
 
 
+def _accept(server_sock: socket.socket, stop_event: threading.Event) -> Optional[tuple[socket.socket, tuple]]:
+    """Wait for the next connection on the non-blocking ``server_sock``.
+
+    Returns ``(connection, address)``, or ``None`` once ``stop_event`` is set.
+    """
+    with _stop_selector(server_sock, stop_event) as selector:
+        timeout = _stop_poll_timeout(stop_event)
+        while not stop_event.is_set():
+            if not selector.select(timeout) or stop_event.is_set():
+                continue
+            try:
+                return server_sock.accept()
+            except BlockingIOError:  # pragma: no cover - connection reset before accept
+                continue
+    return None
+
+
+class _IncomingStream(NamedTuple):
+    """An accepted connection together with the header it opened with."""
+
+    conn: socket.socket
+    wait: Callable[[], None]
+    filename_bytes: bytes
+    file_size: int
+    num_streams: int
+    index: int
+    offset: int
+    length: int
+
+
+def _check_stream_ranges(streams: list[_IncomingStream], file_size: int) -> None:
+    """Require ``streams`` to be numbered ``0..n-1`` and to cover ``[0, file_size)`` exactly."""
+    if sorted(stream.index for stream in streams) != list(range(len(streams))):
+        raise ConnectionError("Received a connection that is not part of the current transfer")
+    position = 0
+    for stream in sorted(streams, key=lambda stream: stream.offset):
+        if stream.offset != position:
+            raise ConnectionError("Sender streams do not cover the whole file")
+        position += stream.length
+    if position != file_size:
+        raise ConnectionError("Sender streams do not cover the whole file")
+
+
+def _receive_stream(
+    conn: socket.socket,
+    wait: Callable[[], None],
+    target_path: Path,
+    offset: int,
+    length: int,
+    stop_event: threading.Event,
+    progress: _Progress,
+) -> None:
+    """Receive ``length`` bytes from ``conn`` into ``target_path`` at ``offset``.
+
+    Raises :class:`ConnectionError` if the data fails its checksum.
+    """
+    # A single reusable buffer avoids allocating a bytes object per chunk.
+    buffer = memoryview(bytearray(_DEFAULT_CHUNK_SIZE))
+    received_total = 0
+    checksum = 0
+    # Each stream writes through its own handle, positioned at its range.
+    with target_path.open("r+b") as dst:
+        dst.seek(offset)
+        while received_total < length:
+            wait()
+            # Drain everything the kernel has buffered before selecting again.
+            while received_total < length:
+                if stop_event.is_set():
+                    raise _TransferCancelled
+                view = buffer[: min(len(buffer), length - received_total)]
+                try:
+                    received = conn.recv_into(view)
+                except BlockingIOError:
+                    break
+                if not received:
+                    raise ConnectionError("Connection closed before file transfer finished")
+                _quickack(conn)
+                dst.write(view[:received])
+                checksum = zlib.crc32(view[:received], checksum)
+                received_total += received
+                progress.add(received)
+
+    if stop_event.is_set():
+        raise _TransferCancelled
+
+    footer = bytearray(_FOOTER_STRUCT.size)
+    _recv_exact_into(conn, memoryview(footer), wait)
+    (expected_checksum,) = _FOOTER_STRUCT.unpack_from(footer, 0)
+    if checksum != expected_checksum:
+        raise ConnectionError("Checksum mismatch: the received file is corrupt")
+
+
 def receive_file(
     port: int,
     destination_dir: os.PathLike[str] | str,
     *,
     progress_callback: Optional[ProgressCallback] = None,
     status_callback: Optional[StatusCallback] = None,
-    stop_event: Optional["threading.Event"] = None,
+    progress_interval: float = _PROGRESS_INTERVAL,
+    stop_event: Optional[threading.Event] = None,
 ) -> Optional[Path]:
     """Listen for an incoming file transfer on ``port``.
 
     ``destination_dir`` is the directory where the received file will be stored.
+    ``progress_callback`` is throttled the same way as in :func:`send_file`.
+    Transfers split over several streams are reassembled in place.
+    Raises :class:`ConnectionError` if the received data fails its checksum.
     Returns the path of the stored file when completed, otherwise ``None``.
+    Pass a :class:`StopEvent` as ``stop_event`` for immediate cancellation.
     """
-    import threading
-
     if stop_event is None:
         stop_event = threading.Event()
 
@@ -168,53 +711,102 @@ def receive_file(
 
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_sock:
         server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Accepted connections inherit these options; the receive buffer must be
+        # sized before the handshake for the advertised window to scale with it.
+        _tune_socket(server_sock, socket.SO_RCVBUF)
         server_sock.bind(("", port))
-        server_sock.listen(1)
-        server_sock.settimeout(1.0)
+        server_sock.listen(MAX_STREAMS)
+        server_sock.setblocking(False)
 
-        while not stop_event.is_set():
-            try:
-                conn, addr = server_sock.accept()
-                break
-            except socket.timeout:
-                continue
-        else:
+        accepted = _accept(server_sock, stop_event)
+        if accepted is None:
             if status_callback:
                 status_callback("Listening cancelled by user.")
             return None
 
+        conn, addr = accepted
         if status_callback:
             status_callback(f"Connected to sender {addr[0]}:{addr[1]}. Receiving file...")
 
-        with conn:
-            header = _recv_exact(conn, _HEADER_STRUCT.size)
-            name_len, file_size = _HEADER_STRUCT.unpack(header)
+        target_path: Optional[Path] = None
+        with contextlib.ExitStack() as stack:
+
+            def open_stream(sock: socket.socket) -> _IncomingStream:
+                # A non-blocking connection lets every wait also watch
+                # ``stop_event``, so a stalled sender can still be cancelled.
+                stack.enter_context(sock)
+                sock.setblocking(False)
+                selector = stack.enter_context(_stop_selector(sock, stop_event))
+                wait = functools.partial(_wait_readable, selector, stop_event)
+                header = bytearray(_HEADER_STRUCT.size)
+                _recv_exact_into(sock, memoryview(header), wait)
+                magic, version, name_len, *fields = _HEADER_STRUCT.unpack_from(header, 0)
+                if (magic, version) != (_PROTOCOL_MAGIC, _PROTOCOL_VERSION):
+                    raise ConnectionError("Sender uses an incompatible version of TransferWithEther")
+                if name_len > _MAX_NAME_LENGTH:
+                    raise ConnectionError(f"Sender announced an implausible file name length ({name_len} bytes)")
+                return _IncomingStream(sock, wait, _recv_exact(sock, name_len, wait), *fields)
 
-            filename_bytes = _recv_exact(conn, name_len)
-
-            filename = filename_bytes.decode("utf-8", errors="replace")
-            target_path = destination / filename
-
-            bytes_received = 0
-            with target_path.open("wb") as dst:
-                while bytes_received < file_size and not stop_event.is_set():
-                    chunk = conn.recv(min(64 * 1024, file_size - bytes_received))
-                    if not chunk:
-                        raise ConnectionError("Connection closed before file transfer finished")
-                    dst.write(chunk)
-                    bytes_received += len(chunk)
-                    if progress_callback:
-                        progress_callback(bytes_received, file_size)
-
-            if stop_event.is_set():
-                target_path.unlink(missing_ok=True)
+            try:
+                first = open_stream(conn)
+                if not 1 <= first.num_streams <= MAX_STREAMS:
+                    raise ConnectionError(f"Sender requested an unsupported number of streams ({first.num_streams})")
+
+                file_size = first.file_size
+                filename = first.filename_bytes.decode("utf-8", errors="replace")
+                _check_free_space(destination, file_size)
+                target_path = destination / filename
+                with target_path.open("w+b") as dst:
+                    _preallocate(dst, file_size)
+
+                streams = [first]
+                while len(streams) < first.num_streams:
+                    accepted = _accept(server_sock, stop_event)
+                    if accepted is None:
+                        raise _TransferCancelled
+                    if accepted[1][0] != addr[0]:
+                        # Only the sender of the first stream may add ranges.
+                        accepted[0].close()
+                        continue
+                    stream = open_stream(accepted[0])
+                    if (stream.filename_bytes, stream.file_size, stream.num_streams) != (
+                        first.filename_bytes,
+                        file_size,
+                        first.num_streams,
+                    ):
+                        raise ConnectionError("Received a connection that is not part of the current transfer")
+                    streams.append(stream)
+                _check_stream_ranges(streams, file_size)
+
+                progress = _Progress(file_size, progress_callback, progress_interval)
+                jobs: list[Callable[[], None]] = [
+                    functools.partial(
+                        _receive_stream,
+                        stream.conn,
+                        stream.wait,
+                        target_path,
+                        stream.offset,
+                        stream.length,
+                        stop_event,
+                        progress,
+                    )
+                    for stream in streams
+                ]
+                _run_streams(jobs, [stream.conn for stream in streams])
+            except _TransferCancelled:
+                if target_path is not None:
+                    target_path.unlink(missing_ok=True)
                 if status_callback:
                     status_callback("Transfer cancelled by user.")
                 return None
+            except BaseException:
+                # The file was preallocated, so a partial one would look complete.
+                if target_path is not None:
+                    target_path.unlink(missing_ok=True)
+                raise
 
-            if progress_callback:
-                progress_callback(file_size, file_size)
-            if status_callback:
-                status_callback(f"File received: {target_path}")
+        progress.finish()
+        if status_callback:
+            status_callback(f"File received: {target_path}")
 
-            return target_path
+        return target_path